@@ -29,6 +29,10 @@ from gremlin.types import InputType
 # List of all joystick devices
 _joystick_devices = []
 
+# Lists of the physical and virtual joystick devices respectively
+_physical_devices = []
+_vjoy_devices = []
+
 # Joystick initialization lock
 _joystick_init_lock = threading.Lock()
 
@@ -87,7 +91,7 @@ def vjoy_devices():
 
     :return list of vJoy devices
     """
-    return [dev for dev in _joystick_devices if dev.is_virtual]
+    return _vjoy_devices
 
 
 def physical_devices():
@@ -95,7 +99,7 @@ def physical_devices():
 
     :return list of physical devices
     """
-    return [dev for dev in _joystick_devices if not dev.is_virtual]
+    return _physical_devices
 
 
 def select_first_valid_vjoy_input(valid_types):
@@ -187,7 +191,8 @@ def joystick_devices_initialization():
     Amongst other things this also ensures that each vJoy device has a correct
     windows id assigned to it.
     """
-    global _joystick_devices, _joystick_init_lock
+    global _joystick_devices, _physical_devices, _vjoy_devices, \
+        _joystick_init_lock
 
     _joystick_init_lock.acquire()
 
@@ -311,15 +316,17 @@ def joystick_devices_initialization():
     # Update device list which will be used when queries for joystick devices
     # are made. Order the devices such that vJoy devices are last and the
     # physical devices are ordered by name.
-    sorted_devices = sorted(
+    physical = sorted(
         [dev for dev in devices if not dev.is_virtual],
         key=lambda x: x.name
     )
-    sorted_devices.extend(sorted(
+    virtual = sorted(
         [dev for dev in devices if dev.is_virtual],
         key=lambda x: x.vjoy_id
-    ))
+    )
 
-    _joystick_devices = sorted_devices
+    _joystick_devices = physical + virtual
+    _physical_devices = physical
+    _vjoy_devices = virtual
 
     _joystick_init_lock.release()
@@ -33,6 +33,9 @@ class CalibrationUi(common.BaseDialogUi):
         super().__init__(parent)
         self.devices = gremlin.joystick_handling.physical_devices()
         self.current_selection_id = 0
+        self._axis_pool = []
+        self._current_device_guid = None
+        self._axis_widgets = {}
 
         # Create the required layouts
         self.main_layout = QtWidgets.QVBoxLayout(self)
@@ -59,8 +62,10 @@ class CalibrationUi(common.BaseDialogUi):
         self.device_dropdown.currentIndexChanged.connect(
             self._create_axes
         )
-        for device in self.devices:
-            self.device_dropdown.addItem(device.name)
+        with QtCore.QSignalBlocker(self.device_dropdown):
+            self.device_dropdown.addItems(
+                [device.name for device in self.devices]
+            )
 
         # Set the title
         self.setWindowTitle("Calibration")
@@ -131,25 +136,40 @@ class CalibrationUi(common.BaseDialogUi):
         :param index the index of the currently selected device
             in the dropdown menu
         """
-        common.clear_layout(self.axes_layout)
-        self.axes = []
         self.current_selection_id = index
-        for i in range(self.devices[index].axis_count):
-            self.axes.append(AxisCalibrationWidget())
-            self.axes_layout.addWidget(self.axes[-1])
+        device = self.devices[index]
+        axis_count = device.axis_count
+
+        # Reuse existing widgets, only creating new ones if the device has
+        # more axes than any device shown before
+        while len(self._axis_pool) < axis_count:
+            self._axis_pool.append(AxisCalibrationWidget())
+            self.axes_layout.addWidget(self._axis_pool[-1])
+        for i, widget in enumerate(self._axis_pool):
+            if i < axis_count:
+                widget.reset()
+                widget.setVisible(True)
+            else:
+                widget.setVisible(False)
+        self.axes = self._axis_pool[:axis_count]
+
+        # Cache information needed to process events of the selected device
+        self._current_device_guid = device.device_guid
+        self._axis_widgets = {
+            entry.axis_index: self.axes[entry.linear_index-1]
+            for entry in device.axis_map
+        }
 
     def _handle_event(self, event):
         """Process a single joystick event.
 
         :param event the event to process
         """
-        if event.device_guid == self.devices[self.current_selection_id].device_guid \
-                and event.event_type == gremlin.common.InputType.JoystickAxis:
-            axis_id = gremlin.joystick_handling.linear_axis_index(
-                self.devices[self.current_selection_id].axis_map,
-                event.identifier
-            )
-            self.axes[axis_id-1].set_current(event.raw_value)
+        if event.device_guid != self._current_device_guid or \
+                event.event_type != gremlin.common.InputType.JoystickAxis:
+            return
+
+        self._axis_widgets[event.identifier].set_current(event.raw_value)
 
     def closeEvent(self, event):
         """Closes the calibration window.
@@ -216,6 +236,12 @@ class AxisCalibrationWidget(QtWidgets.QWidget):
             self.limits[0] = value
         self._update_labels()
 
+    def reset(self):
+        """Resets the recorded limits and current value of the axis."""
+        self.limits = [0, 0, 0]
+        self.slider.setValue(self.limits[1])
+        self._update_labels()
+
     def centered(self):
         """Records the value of the center or neutral position."""
         self.limits[1] = self.slider.value()
@@ -553,7 +553,9 @@ class AbstractInputSelector(QtWidgets.QWidget):
         self.device_dropdown = None
         self.input_item_dropdowns = []
         self._device_id_registry = []
-        self._input_type_registry = []
+        self._input_registry = []
+        self._input_index_registry = []
+        self._visible_index = 0
 
         self._initialize()
         self._create_device_dropdown()
@@ -568,19 +570,10 @@ class AbstractInputSelector(QtWidgets.QWidget):
         if device_index != -1:
             device_id = self._device_id_registry[device_index]
             input_index = self.input_item_dropdowns[device_index].currentIndex()
-
             if input_index == -1:
                 input_index = 0
-                input_value = self.input_item_dropdowns[device_index].itemText(
-                    input_index)
-            else:
-                input_value = self.input_item_dropdowns[device_index].currentText()
-            input_type = self._input_type_registry[device_index][input_index]
-
-            if input_type == gremlin.common.InputType.JoystickAxis:
-                input_id = gremlin.common.AxisNames.to_enum(input_value).value
-            else:
-                input_id = int(input_value.split()[-1])
+            input_type, input_id = \
+                self._input_registry[device_index][input_index]
 
         return {
             "device_id": device_id,
@@ -596,26 +589,33 @@ class AbstractInputSelector(QtWidgets.QWidget):
         dev_id = self._device_id_registry.index(device_id)
 
         # Retrieve the index of the correct entry in the combobox
-        input_name = gremlin.common.input_to_ui_string(input_type, input_id)
-        entry_id = self.input_item_dropdowns[dev_id].findText(input_name)
+        entry_id = self._input_index_registry[dev_id].get(
+            (input_type, input_id),
+            -1
+        )
 
         # Select and display correct combo boxes and entries within
         self.device_dropdown.setCurrentIndex(dev_id)
-        for entry in self.input_item_dropdowns:
-            entry.setVisible(False)
-        self.input_item_dropdowns[dev_id].setVisible(True)
+        self._show_input_dropdown(dev_id)
         self.input_item_dropdowns[dev_id].setCurrentIndex(entry_id)
 
     def _update_device(self, index):
-        # Hide all selection dropdowns
-        for entry in self.input_item_dropdowns:
-            entry.setVisible(False)
-
-        # Show correct dropdown
-        self.input_item_dropdowns[index].setVisible(True)
+        self._show_input_dropdown(index)
         self.input_item_dropdowns[index].setCurrentIndex(0)
         self._execute_callback()
 
+    def _show_input_dropdown(self, index):
+        """Shows the input dropdown of the given device, hiding the old one.
+
+        :param index the index of the device whose dropdown to show
+        """
+        if index == self._visible_index:
+            return
+
+        self.input_item_dropdowns[self._visible_index].setVisible(False)
+        self.input_item_dropdowns[index].setVisible(True)
+        self._visible_index = index
+
     def _initialize(self):
         raise gremlin.error.MissingImplementationError(
             "Missing implementation of AbstractInputSelector._initialize"
@@ -647,27 +647,34 @@ class AbstractInputSelector(QtWidgets.QWidget):
         }
 
         self.input_item_dropdowns = []
-        self._input_type_registry = []
+        self._input_registry = []
+        self._input_index_registry = []
 
         # Create input item selections for the devices. Each selection
         # will be invisible unless it is selected as the active device
         for device in self.device_list:
             selection = QtWidgets.QComboBox(self)
             selection.setMaxVisibleItems(20)
-            self._input_type_registry.append([])
+            self._input_registry.append([])
 
-            # Add items based on the input type
+            # Add items based on the input type, collecting all names first
+            # so the combo box is populated in a single model update
+            input_names = []
             for input_type in self.valid_types:
                 for i in range(count_map[input_type](device)):
                     input_id = i+1
                     if input_type == gremlin.common.InputType.JoystickAxis:
                         input_id = device.axis_map[i].axis_index
 
-                    selection.addItem(gremlin.common.input_to_ui_string(
+                    input_names.append(gremlin.common.input_to_ui_string(
                         input_type,
                         input_id
                     ))
-                    self._input_type_registry[-1].append(input_type)
+                    self._input_registry[-1].append((input_type, input_id))
+            selection.addItems(input_names)
+            self._input_index_registry.append(
+                {entry: i for i, entry in enumerate(self._input_registry[-1])}
+            )
 
             # Add the selection and hide it
             selection.setVisible(False)
@@ -676,6 +683,7 @@ class AbstractInputSelector(QtWidgets.QWidget):
             self.input_item_dropdowns.append(selection)
 
         # Show the first entry by default
+        self._visible_index = 0
         if len(self.input_item_dropdowns) > 0:
             self.input_item_dropdowns[0].setVisible(True)
 
@@ -687,20 +695,33 @@ class JoystickSelector(AbstractInputSelector):
 
     """Widget allowing the selection of input items on a physical joystick."""
 
-    def __init__(self, change_cb, valid_types, parent=None):
+    def __init__(self, change_cb, valid_types, devices=None, parent=None):
         """Creates a new JoystickSelector instance.
 
         :param change_cb function to call when changes occur
         :param valid_types valid input types for selection
+        :param devices list of candidate devices as returned by
+            candidate_devices, queried if not provided
         :param parent the parent of this widget
         """
+        self._candidate_devices = devices
         super().__init__(change_cb, valid_types, parent)
 
-    def _initialize(self):
-        potential_devices = sorted(
+    @staticmethod
+    def candidate_devices():
+        """Returns the physical devices that can potentially be selected.
+
+        :return list of physical devices sorted by name
+        """
+        return sorted(
             gremlin.joystick_handling.physical_devices(),
             key=lambda x: (x.name, x.device_guid)
         )
+
+    def _initialize(self):
+        potential_devices = self._candidate_devices
+        if potential_devices is None:
+            potential_devices = JoystickSelector.candidate_devices()
         for dev in potential_devices:
             input_counts = {
                 gremlin.common.InputType.JoystickAxis: dev.axis_count,
@@ -727,22 +748,42 @@ class VJoySelector(AbstractInputSelector):
 
     """Widget allowing the selection of vJoy inputs."""
 
-    def __init__(self, change_cb, valid_types, invalid_ids={}, parent=None):
+    def __init__(
+            self,
+            change_cb,
+            valid_types,
+            invalid_ids={},
+            devices=None,
+            parent=None
+    ):
         """Creates a widget to select a vJoy output.
 
         :param change_cb callback to execute when the widget changes
         :param valid_types the input type to present in the selection
         :param invalid_ids list of vid values of vjoy devices to not consider
+        :param devices list of candidate devices as returned by
+            candidate_devices, queried if not provided
         :param parent of this widget
         """
         self.invalid_ids = invalid_ids
+        self._candidate_devices = devices
         super().__init__(change_cb, valid_types, parent)
 
-    def _initialize(self):
-        potential_devices = sorted(
+    @staticmethod
+    def candidate_devices():
+        """Returns the vJoy devices that can potentially be selected.
+
+        :return list of vJoy devices sorted by their id
+        """
+        return sorted(
             gremlin.joystick_handling.vjoy_devices(),
             key=lambda x: x.vjoy_id
         )
+
+    def _initialize(self):
+        potential_devices = self._candidate_devices
+        if potential_devices is None:
+            potential_devices = VJoySelector.candidate_devices()
         for dev in potential_devices:
             input_counts = {
                 gremlin.common.InputType.JoystickAxis: dev.axis_count,
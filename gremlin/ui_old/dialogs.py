@@ -15,6 +15,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import bisect
+import codecs
+import contextlib
+import functools
+import io
 import os
 import subprocess
 import sys
@@ -28,6 +33,48 @@ import gremlin
 from . import common, ui_about
 
 
+# Resource files whose content is shown in the third party licenses tab
+_THIRD_PARTY_LICENSE_FILES = [
+    "about/third_party_licenses.html",
+    "about/modernuiicons.html",
+    "about/pyqt.html",
+    "about/pywin32.html",
+    "about/qt5.html",
+    "about/reportlab.html",
+    "about/vjoy.html",
+]
+
+
+# Icons already loaded from disk, indexed by their path
+_icon_cache = {}
+
+
+def _icon(path):
+    """Returns the icon stored at the given path.
+
+    Icons are only loaded from disk the first time they are requested.
+
+    :param path path to the icon's image file
+    :return QIcon instance of the requested icon
+    """
+    if path not in _icon_cache:
+        _icon_cache[path] = QtGui.QIcon(path)
+    return _icon_cache[path]
+
+
+@functools.lru_cache(maxsize=None)
+def _read_html(fname):
+    """Returns the content of the given resource file.
+
+    The file is only read from disk the first time it is requested.
+
+    :param fname path of the resource file to read
+    :return content of the file
+    """
+    with open(gremlin.util.resource_path(fname), encoding="utf-8") as fhandle:
+        return fhandle.read()
+
+
 class OptionsUi(common.BaseDialogUi):
 
     """UI allowing the configuration of a variety of options."""
@@ -43,6 +90,13 @@ class OptionsUi(common.BaseDialogUi):
         self.config = gremlin.config.Configuration()
         self.setMinimumWidth(400)
 
+        # Timer coalescing multiple option changes into a single write of
+        # the configuration file
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self.config.save)
+
         self.setWindowTitle("Options")
 
         self.main_layout = QtWidgets.QVBoxLayout(self)
@@ -205,16 +259,16 @@ If this option is on, the last active profile will remain active until a differe
             self._show_executable
         )
         self.executable_add = QtWidgets.QPushButton()
-        self.executable_add.setIcon(QtGui.QIcon("gfx/button_add.png"))
+        self.executable_add.setIcon(_icon("gfx/button_add.png"))
         self.executable_add.clicked.connect(self._new_executable)
         self.executable_remove = QtWidgets.QPushButton()
-        self.executable_remove.setIcon(QtGui.QIcon("gfx/button_delete.png"))
+        self.executable_remove.setIcon(_icon("gfx/button_delete.png"))
         self.executable_remove.clicked.connect(self._remove_executable)
         self.executable_edit = QtWidgets.QPushButton()
-        self.executable_edit.setIcon(QtGui.QIcon("gfx/button_edit.png"))
+        self.executable_edit.setIcon(_icon("gfx/button_edit.png"))
         self.executable_edit.clicked.connect(self._edit_executable)
         self.executable_list = QtWidgets.QPushButton()
-        self.executable_list.setIcon(QtGui.QIcon("gfx/list_show.png"))
+        self.executable_list.setIcon(_icon("gfx/list_show.png"))
         self.executable_list.clicked.connect(self._list_executables)
 
         self.executable_layout.addWidget(self.executable_label)
@@ -227,10 +281,9 @@ If this option is on, the last active profile will remain active until a differe
 
         self.profile_layout = QtWidgets.QHBoxLayout()
         self.profile_field = QtWidgets.QLineEdit()
-        self.profile_field.textChanged.connect(self._update_profile)
         self.profile_field.editingFinished.connect(self._update_profile)
         self.profile_select = QtWidgets.QPushButton()
-        self.profile_select.setIcon(QtGui.QIcon("gfx/button_edit.png"))
+        self.profile_select.setIcon(_icon("gfx/button_edit.png"))
         self.profile_select.clicked.connect(self._select_profile)
 
         self.profile_layout.addWidget(self.profile_field)
@@ -322,6 +375,7 @@ If this option is on, the last active profile will remain active until a differe
 
         :param event the close event
         """
+        self._save_timer.stop()
         self.config.save()
         super().closeEvent(event)
 
@@ -330,12 +384,9 @@ If this option is on, the last active profile will remain active until a differe
 
         :param executable_name name of the executable to pre select
         """
-        self.profile_field.textChanged.disconnect(self._update_profile)
-        self.executable_selection.clear()
         executable_list = self.config.get_executable_list()
-        for path in executable_list:
-            self.executable_selection.addItem(path)
-        self.profile_field.textChanged.connect(self._update_profile)
+        self.executable_selection.clear()
+        self.executable_selection.addItems(executable_list)
 
         # Select the provided executable if it exists, otherwise the first one
         # in the list
@@ -351,7 +402,7 @@ If this option is on, the last active profile will remain active until a differe
         """
         self.keep_last_autoload_checkbox.setEnabled(clicked)
         self.config.autoload_profiles = clicked
-        self.config.save()
+        self._save_timer.start()
 
     def _keep_last_autoload(self, clicked):
         """Stores keep last autoload preference.
@@ -359,7 +410,7 @@ If this option is on, the last active profile will remain active until a differe
         :param clicked whether or not the checkbox is ticked
         """
         self.config.keep_last_autoload = clicked
-        self.config.save()
+        self._save_timer.start()
 
     def _activate_on_launch(self, clicked):
         """Stores activation of profile on launch preference.
@@ -367,7 +418,7 @@ If this option is on, the last active profile will remain active until a differe
         :param clicked whether or not the checkbox is ticked
         """
         self.config.activate_on_launch = clicked
-        self.config.save()
+        self._save_timer.start()
 
     def _close_to_systray(self, clicked):
         """Stores closing to system tray preference.
@@ -375,7 +426,7 @@ If this option is on, the last active profile will remain active until a differe
         :param clicked whether or not the checkbox is ticked
         """
         self.config.close_to_tray = clicked
-        self.config.save()
+        self._save_timer.start()
 
     def _start_minimized(self, clicked):
         """Stores start minimized preference.
@@ -383,7 +434,7 @@ If this option is on, the last active profile will remain active until a differe
         :param clicked whether or not the checkbox is ticked
         """
         self.config.start_minimized = clicked
-        self.config.save()
+        self._save_timer.start()
 
     def _start_windows(self, clicked):
         """Set registry entry to launch Joystick Gremlin on login.
@@ -424,7 +475,7 @@ If this option is on, the last active profile will remain active until a differe
         :param clicked whether or not the checkbox is ticked
         """
         self.config.highlight_input = clicked
-        self.config.save()
+        self._save_timer.start()
 
     def _highlight_device(self, clicked):
         """Stores preference for device highlighting.
@@ -432,7 +483,7 @@ If this option is on, the last active profile will remain active until a differe
         :param clicked whether or not the checkbox is ticked
         """
         self.config.highlight_device = clicked
-        self.config.save()
+        self._save_timer.start()
 
     def _list_executables(self):
         """Shows a list of executables for the user to pick."""
@@ -525,7 +576,7 @@ If this option is on, the last active profile will remain active until a differe
 
         :param clicked whether or not the checkbox is ticked"""
         self.config.mode_change_message = clicked
-        self.config.save()
+        self._save_timer.start()
 
     def _update_profile(self):
         """Updates the profile associated with the current executable."""
@@ -551,7 +602,7 @@ If this option is on, the last active profile will remain active until a differe
         :param value the name of the newly selected action
         """
         self.config.default_action = value
-        self.config.save()
+        self._save_timer.start()
 
     def _macro_axis_polling_rate(self, value):
         """Updates the config with the newly set polling rate.
@@ -559,7 +610,7 @@ If this option is on, the last active profile will remain active until a differe
         :param value the new polling rate
         """
         self.config.macro_axis_polling_rate = value
-        self.config.save()
+        self._save_timer.start()
 
     def _macro_axis_minimum_change_value(self, value):
         """Updates the config with the newly set minimum change value.
@@ -603,6 +654,9 @@ class ProcessWindow(common.BaseDialogUi):
             gremlin.process_monitor.list_current_processes()
         )
         self.list_view = QtWidgets.QListView()
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setLayoutMode(QtWidgets.QListView.Batched)
+        self.list_view.setBatchSize(100)
         self.list_view.setModel(self.list_model)
         self.list_view.setEditTriggers(
             QtWidgets.QAbstractItemView.NoEditTriggers
@@ -638,6 +692,8 @@ class LogWindowUi(common.BaseDialogUi):
         self.main_layout.addWidget(self.tab_container)
 
         self._ui_elements = {}
+        self._log_offsets = {}
+        self._log_decoders = {}
         self._create_log_display(
             os.path.join(gremlin.util.userprofile_path(), "system.log"),
             "System"
@@ -669,9 +725,12 @@ class LogWindowUi(common.BaseDialogUi):
         page = QtWidgets.QWidget()
         layout = QtWidgets.QVBoxLayout(page)
         log_display = QtWidgets.QTextEdit()
-        log_display.setText(open(fname).read())
+        log_display.setAcceptRichText(False)
+        log_display.setLineWrapMode(QtWidgets.QTextEdit.NoWrap)
+        log_display.setPlainText(self._read_log(fname)[0])
         button = QtWidgets.QPushButton("Clear log")
-        button.clicked.connect(lambda: self._clear_log(fname))
+        button.setProperty("log_path", fname)
+        button.clicked.connect(self._clear_log_cb)
         layout.addWidget(log_display)
         layout.addWidget(button)
 
@@ -687,6 +746,10 @@ class LogWindowUi(common.BaseDialogUi):
             title
         )
 
+    def _clear_log_cb(self):
+        """Clears the log file associated with the clicked button."""
+        self._clear_log(self.sender().property("log_path"))
+
     def _clear_log(self, fname):
         """Clears the specified log file.
 
@@ -694,13 +757,52 @@ class LogWindowUi(common.BaseDialogUi):
         """
         open(fname, "w").close()
 
+    def _read_log(self, fname):
+        """Reads the content of a log file not yet read.
+
+        Only the data appended since the last read is returned unless the
+        file shrank, e.g. due to being cleared, in which case the entire
+        file is read again. Bytes of a character that has only been
+        partially written are kept until the remainder is read. Line
+        endings are converted to newline characters.
+
+        :param fname path to the log file to read
+        :return tuple of the read content and offset at which reading started
+        """
+        # Read in binary mode, as text mode on Windows translates line
+        # endings which would make the offset not match the file position
+        fd = os.open(fname, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            size = os.fstat(fd).st_size
+            offset = self._log_offsets.get(fname, 0)
+            if size < offset:
+                offset = 0
+            os.lseek(fd, offset, os.SEEK_SET)
+            data = os.read(fd, size - offset)
+        finally:
+            os.close(fd)
+
+        self._log_offsets[fname] = offset + len(data)
+        if offset == 0 or fname not in self._log_decoders:
+            self._log_decoders[fname] = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder("utf-8")("replace"),
+                translate=True
+            )
+        return self._log_decoders[fname].decode(data), offset
+
     def _reload(self, fname):
         """Reloads the content of tab displaying the given file.
 
         :param fname name of the file whose content to update
         """
         widget = self._ui_elements[fname]["log_display"]
-        widget.setText(open(fname).read())
+        content, offset = self._read_log(fname)
+        if offset == 0:
+            widget.setPlainText(content)
+        else:
+            cursor = QtGui.QTextCursor(widget.document())
+            cursor.movePosition(QtGui.QTextCursor.End)
+            cursor.insertText(content)
         widget.verticalScrollBar().setValue(
             widget.verticalScrollBar().maximum()
         )
@@ -722,28 +824,74 @@ class AboutUi(common.BaseDialogUi):
         self.ui = ui_about.Ui_About()
         self.ui.setupUi(self)
 
-        self.ui.about.setHtml(
-            open(gremlin.util.resource_path("about/about.html")).read()
-        )
+        self.ui.about.setHtml(_read_html("about/about.html"))
+        self.ui.jg_license.setHtml(_read_html("about/joystick_gremlin.html"))
+
+        # The third party licenses are only loaded once their tab is shown
+        self._licenses_loaded = False
+        self._pending_licenses = []
+        self.ui.tabWidget.currentChanged.connect(self._load_licenses)
+
+    def _load_licenses(self, index):
+        """Populates the third party licenses tab when it is first shown.
+
+        :param index the index of the currently selected tab
+        """
+        if self._licenses_loaded or \
+                self.ui.tabWidget.widget(index) is not self.ui.tab_3:
+            return
+
+        self._licenses_loaded = True
+        self._pending_licenses = list(_THIRD_PARTY_LICENSE_FILES)
+        QtCore.QTimer.singleShot(0, self._insert_next_license)
+
+    def _insert_next_license(self):
+        """Appends the next third party license to the licenses tab.
+
+        Licenses are inserted one per event loop iteration so that parsing
+        and laying out the HTML does not block the UI for long.
+        """
+        if len(self._pending_licenses) == 0:
+            return
+
+        cursor = QtGui.QTextCursor(self.ui.third_party_licenses.document())
+        cursor.movePosition(QtGui.QTextCursor.End)
+        cursor.insertHtml(_read_html(self._pending_licenses.pop(0)))
+        cursor.insertHtml("<hr>")
+
+        if len(self._pending_licenses) > 0:
+            QtCore.QTimer.singleShot(0, self._insert_next_license)
 
-        self.ui.jg_license.setHtml(
-            open(gremlin.util.resource_path("about/joystick_gremlin.html")).read()
-        )
 
-        license_list = [
-            "about/third_party_licenses.html",
-            "about/modernuiicons.html",
-            "about/pyqt.html",
-            "about/pywin32.html",
-            "about/qt5.html",
-            "about/reportlab.html",
-            "about/vjoy.html",
-        ]
-        third_party_licenses = ""
-        for fname in license_list:
-            third_party_licenses += open(gremlin.util.resource_path(fname)).read()
-            third_party_licenses += "<hr>"
-        self.ui.third_party_licenses.setHtml(third_party_licenses)
+class ParentModeFilterModel(QtCore.QSortFilterProxyModel):
+
+    """Hides a single mode from the list of modes shown by a dropdown."""
+
+    def __init__(self, parent=None):
+        """Creates a new instance.
+
+        :param parent the parent of this model
+        """
+        super().__init__(parent)
+        self._mode = None
+
+    def set_mode(self, mode):
+        """Sets the name of the mode to hide.
+
+        :param mode the name of the mode to hide
+        """
+        self._mode = mode
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        """Returns whether or not the given row should be shown.
+
+        :param source_row the row in the source model
+        :param source_parent the parent index in the source model
+        :return True if the row does not contain the hidden mode
+        """
+        index = self.sourceModel().index(source_row, 0, source_parent)
+        return index.data() != self._mode
 
 
 class ModeManagerUi(common.BaseDialogUi):
@@ -753,6 +901,10 @@ class ModeManagerUi(common.BaseDialogUi):
     # Signal emitted when mode configuration changes
     modes_changed = QtCore.pyqtSignal()
 
+    # Icons shared by the buttons of every mode, loaded by the first instance
+    edit_icon = None
+    delete_icon = None
+
     def __init__(self, profile_data, parent=None):
         """Creates a new instance.
 
@@ -762,12 +914,27 @@ class ModeManagerUi(common.BaseDialogUi):
         """
         super().__init__(parent)
         self._profile = profile_data
+        # All devices share the same modes, any one of them can be used to
+        # query mode information
+        self._reference_device = \
+            next(iter(self._profile.devices.values()), None)
         self.setWindowTitle("Mode Manager")
 
+        if ModeManagerUi.edit_icon is None:
+            ModeManagerUi.edit_icon = _icon("gfx/button_edit.png")
+            ModeManagerUi.delete_icon = _icon("gfx/mode_delete")
+
+        self.mode_labels = {}
         self.mode_dropdowns = {}
         self.mode_rename = {}
         self.mode_delete = {}
-        self.mode_callbacks = {}
+        # Parent choices shared by all mode dropdowns
+        self._parent_model = None
+        # Names of all modes and the ancestors of each mode
+        self._mode_names = set()
+        self._ancestors = {}
+        # Whether a modes changed notification is scheduled to be emitted
+        self._modes_changed_pending = False
 
         self._create_ui()
 
@@ -815,95 +982,128 @@ class ModeManagerUi(common.BaseDialogUi):
         """Generates the mode layout UI displaying the different modes."""
         # Clear potentially existing content
         common.clear_layout(self.mode_layout)
+        self.mode_labels = {}
         self.mode_dropdowns = {}
         self.mode_rename = {}
         self.mode_delete = {}
-        self.mode_callbacks = {}
 
-        # Obtain mode names and the mode they inherit from
-        mode_list = {}
-        for device in self._profile.devices.values():
-            for mode in device.modes.values():
-                if mode.name not in mode_list:
-                    # FIXME: somewhere a mode's name is not set
-                    if mode.name is None:
-                        continue
-                    mode_list[mode.name] = mode.inherit
+        # Obtain mode names and the mode they inherit from, inheritance is
+        # identical across devices as it is always changed on all of them
+        # FIXME: somewhere a mode's name is not set
+        mode_list = {
+            mode.name: mode.inherit
+            for device in self._profile.devices.values()
+            for mode in device.modes.values()
+            if mode.name is not None
+        }
+
+        self._mode_names = set(mode_list)
+        self._compute_ancestors()
 
         # Add header information
         self.mode_layout.addWidget(QtWidgets.QLabel("<b>Name</b>"), 0, 0)
         self.mode_layout.addWidget(QtWidgets.QLabel("<b>Parent</b>"), 0, 1)
 
-        # Create UI element for each mode
+        # Create UI element for each mode, all dropdowns show the same
+        # list of potential parents
+        mode_names = sorted(mode_list.keys())
+        self._parent_model = QtCore.QStringListModel(
+            ["None"] + mode_names,
+            self
+        )
         row = 1
-        for mode, inherit in sorted(mode_list.items()):
-            self.mode_layout.addWidget(QtWidgets.QLabel(mode), row, 0)
-            self.mode_dropdowns[mode] = QtWidgets.QComboBox()
-            self.mode_dropdowns[mode].addItem("None")
-            self.mode_dropdowns[mode].setMinimumContentsLength(20)
-            for name in sorted(mode_list.keys()):
-                if name != mode:
-                    self.mode_dropdowns[mode].addItem(name)
-
-            self.mode_callbacks[mode] = self._create_inheritance_change_cb(mode)
-            self.mode_dropdowns[mode].currentTextChanged.connect(
-                self.mode_callbacks[mode]
-            )
-            self.mode_dropdowns[mode].setCurrentText(inherit)
-
-            # Rename mode button
-            self.mode_rename[mode] = QtWidgets.QPushButton(
-                QtGui.QIcon("gfx/button_edit.png"), ""
-            )
-            self.mode_layout.addWidget(self.mode_rename[mode], row, 2)
-            self.mode_rename[mode].clicked.connect(
-                self._create_rename_mode_cb(mode)
-            )
-            # Delete mode button
-            self.mode_delete[mode] = QtWidgets.QPushButton(
-                QtGui.QIcon("gfx/mode_delete"), ""
-            )
-            self.mode_layout.addWidget(self.mode_delete[mode], row, 3)
-            self.mode_delete[mode].clicked.connect(
-                self._create_delete_mode_cb(mode)
-            )
-
-            self.mode_layout.addWidget(self.mode_dropdowns[mode], row, 1)
+        for mode in mode_names:
+            self._add_mode_row(mode, mode_list[mode], row)
             row += 1
 
-    def _create_inheritance_change_cb(self, mode):
-        """Returns a lambda function callback to change the inheritance of
-        a mode.
-
-        This is required as otherwise lambda functions created within a
-        function do not behave as desired.
+    def _add_mode_row(self, mode, inherit, row):
+        """Creates the UI elements representing a single mode.
 
-        :param mode the mode for which the callback is being created
-        :return customized lambda function
+        :param mode the name of the mode
+        :param inherit the name of the mode's parent, None if it has none
+        :param row the layout row in which to place the UI elements
         """
-        return lambda x: self._change_mode_inheritance(mode, x)
-
-    def _create_rename_mode_cb(self, mode):
-        """Returns a lambda function callback to rename a mode.
+        self.mode_labels[mode] = QtWidgets.QLabel()
+        self.mode_layout.addWidget(self.mode_labels[mode], row, 0)
+        self.mode_dropdowns[mode] = QtWidgets.QComboBox()
+        self.mode_dropdowns[mode].setMinimumContentsLength(20)
+        self.mode_dropdowns[mode].setMaxVisibleItems(15)
+        # Show all modes except the one the dropdown belongs to
+        parent_model = ParentModeFilterModel(self.mode_dropdowns[mode])
+        parent_model.setSourceModel(self._parent_model)
+        self.mode_dropdowns[mode].setModel(parent_model)
+
+        # Rename mode button
+        self.mode_rename[mode] = QtWidgets.QPushButton(
+            ModeManagerUi.edit_icon, ""
+        )
+        self.mode_layout.addWidget(self.mode_rename[mode], row, 2)
+        self.mode_rename[mode].clicked.connect(self._rename_mode_cb)
+        # Delete mode button
+        self.mode_delete[mode] = QtWidgets.QPushButton(
+            ModeManagerUi.delete_icon, ""
+        )
+        self.mode_layout.addWidget(self.mode_delete[mode], row, 3)
+        self.mode_delete[mode].clicked.connect(self._delete_mode_cb)
+
+        self.mode_layout.addWidget(self.mode_dropdowns[mode], row, 1)
+        # Hide the mode from its own dropdown before selecting the parent,
+        # as filtering the model may change the selected entry
+        self._set_row_mode(mode)
+
+        # Select the current parent without triggering the callback
+        # which would otherwise write the same value back
+        self.mode_dropdowns[mode].currentTextChanged.connect(
+            self._inheritance_change_cb
+        )
+        with QtCore.QSignalBlocker(self.mode_dropdowns[mode]):
+            self.mode_dropdowns[mode].setCurrentText(
+                inherit if inherit else "None"
+            )
 
-        This is required as otherwise lambda functions created within a
-        function do not behave as desired.
+    def _set_row_mode(self, mode):
+        """Records the mode a row represents with the row's widgets.
 
-        :param mode the mode for which the callback is being created
-        :return customized lambda function
+        :param mode the name of the mode represented by the row
         """
-        return lambda: self._rename_mode(mode)
-
-    def _create_delete_mode_cb(self, mode):
-        """Returns a lambda function callback to delete the given mode.
+        self.mode_labels[mode].setText(mode)
+        for widget in [
+            self.mode_dropdowns[mode],
+            self.mode_rename[mode],
+            self.mode_delete[mode]
+        ]:
+            widget.setProperty("mode", mode)
+        self.mode_dropdowns[mode].model().set_mode(mode)
+
+    def _remove_mode_row(self, mode):
+        """Removes the UI elements representing the given mode.
+
+        :param mode the name of the mode whose UI elements to remove
+        """
+        for widget in [
+            self.mode_labels.pop(mode),
+            self.mode_dropdowns.pop(mode),
+            self.mode_rename.pop(mode),
+            self.mode_delete.pop(mode)
+        ]:
+            self.mode_layout.removeWidget(widget)
+            widget.hide()
+            widget.deleteLater()
+
+    def _inheritance_change_cb(self, inherit):
+        """Changes the parent of the mode whose dropdown emitted the signal.
+
+        :param inherit the name of the newly selected parent
+        """
+        self._change_mode_inheritance(self.sender().property("mode"), inherit)
 
-        This is required as otherwise lambda functions created within a
-        function do not behave as desired.
+    def _rename_mode_cb(self):
+        """Renames the mode whose rename button was clicked."""
+        self._rename_mode(self.sender().property("mode"))
 
-        :param mode the mode to remove
-        :return lambda function to perform the removal
-        """
-        return lambda: self._delete_mode(mode)
+    def _delete_mode_cb(self):
+        """Deletes the mode whose delete button was clicked."""
+        self._delete_mode(self.sender().property("mode"))
 
     def _change_mode_inheritance(self, mode, inherit):
         """Updates the inheritance information of a given mode.
@@ -911,26 +1111,114 @@ class ModeManagerUi(common.BaseDialogUi):
         :param mode the mode to update
         :param inherit the name of the mode this mode inherits from
         """
+        if inherit == "None":
+            inherit = None
+
         # Check if this inheritance would cause a cycle, turning the
         # tree structure into a graph
-        has_inheritance_cycle = False
-        if inherit != "None":
-            all_modes = list(self._profile.devices.values())[0].modes
-            cur_mode = inherit
-            while all_modes[cur_mode].inherit is not None:
-                if all_modes[cur_mode].inherit == mode:
-                    has_inheritance_cycle = True
-                    break
-                cur_mode = all_modes[cur_mode].inherit
+        if inherit is not None and mode in self._ancestors.get(inherit, ()):
+            return
 
         # Update the inheritance information in the profile
-        if not has_inheritance_cycle:
-            for name, device in self._profile.devices.items():
-                if inherit == "None":
-                    inherit = None
-                device.ensure_mode_exists(mode)
-                device.modes[mode].inherit = inherit
-            self.modes_changed.emit()
+        for name, device in self._profile.devices.items():
+            device.ensure_mode_exists(mode)
+            device.modes[mode].inherit = inherit
+        self._update_ancestors(mode, inherit)
+        self._emit_modes_changed()
+
+    def _emit_modes_changed(self):
+        """Schedules the emission of the modes changed signal.
+
+        All changes made within the same event loop iteration result in a
+        single emission of the signal.
+        """
+        if not self._modes_changed_pending:
+            self._modes_changed_pending = True
+            QtCore.QTimer.singleShot(0, self._flush_modes_changed)
+
+    def _flush_modes_changed(self):
+        """Emits the modes changed signal scheduled previously."""
+        self._modes_changed_pending = False
+        self.modes_changed.emit()
+
+    def _compute_ancestors(self):
+        """Computes the set of ancestors of every mode in the profile.
+
+        Each mode's inheritance chain is only walked until a mode whose
+        ancestors are already known is encountered.
+        """
+        self._ancestors = {}
+        # Without any devices the profile contains no modes
+        if self._reference_device is None:
+            return
+
+        all_modes = self._reference_device.modes
+        for name in all_modes:
+            chain = []
+            cur_mode = name
+            while cur_mode is not None and cur_mode not in self._ancestors:
+                chain.append(cur_mode)
+                cur_mode = all_modes[cur_mode].inherit
+
+            ancestors = set()
+            if cur_mode is not None:
+                ancestors = self._ancestors[cur_mode] | {cur_mode}
+            for entry in reversed(chain):
+                self._ancestors[entry] = ancestors
+                ancestors = ancestors | {entry}
+
+    def _update_ancestors(self, mode, inherit):
+        """Updates the ancestors of a mode and its descendants.
+
+        :param mode the mode whose parent changed
+        :param inherit the name of the new parent, None if there is none
+        """
+        old_ancestors = self._ancestors.get(mode, set())
+        new_ancestors = set()
+        if inherit is not None:
+            new_ancestors = self._ancestors[inherit] | {inherit}
+
+        self._ancestors[mode] = new_ancestors
+        for name, ancestors in self._ancestors.items():
+            if mode in ancestors:
+                self._ancestors[name] = \
+                    (ancestors - old_ancestors) | new_ancestors
+
+    def _insert_parent_entry(self, name):
+        """Inserts a mode into the sorted list of potential parents.
+
+        Inserting an entry can change the selected index of the dropdowns,
+        their signals thus have to be blocked by the caller.
+
+        :param name the name of the mode to insert
+        """
+        row = bisect.bisect(self._parent_model.stringList(), name, 1)
+        self._parent_model.insertRow(row)
+        self._parent_model.setData(self._parent_model.index(row), name)
+
+    def _get_mode_name(self, name=""):
+        """Asks the user for the name of a mode.
+
+        Names starting with whitespace are rejected while typing.
+
+        :param name the name initially shown to the user
+        :return tuple of the provided name and whether the user accepted it
+        """
+        dialog = QtWidgets.QInputDialog(self)
+        dialog.setWindowTitle("Mode name")
+        dialog.setLabelText("")
+        dialog.setInputMode(QtWidgets.QInputDialog.TextInput)
+        dialog.setTextValue(name)
+        dialog.findChild(QtWidgets.QLineEdit).setValidator(
+            QtGui.QRegularExpressionValidator(
+                QtCore.QRegularExpression(r"^\S.*$"),
+                dialog
+            )
+        )
+        user_input = dialog.exec_() == QtWidgets.QDialog.Accepted
+        name = dialog.textValue()
+        dialog.deleteLater()
+        return name, user_input
 
     def _rename_mode(self, mode_name):
         """Asks the user for the new name for the given mode.
@@ -941,15 +1229,9 @@ class ModeManagerUi(common.BaseDialogUi):
         :param mode_name new name for the mode
         """
         # Retrieve new name from the user
-        name, user_input = QtWidgets.QInputDialog.getText(
-                self,
-                "Mode name",
-                "",
-                QtWidgets.QLineEdit.Normal,
-                mode_name
-        )
-        if user_input:
-            if name in gremlin.profile.mode_list(self._profile):
+        name, user_input = self._get_mode_name(mode_name)
+        if user_input and name:
+            if name in self._mode_names:
                 gremlin.util.display_error(
                     "A mode with the name \"{}\" already exists".format(name)
                 )
@@ -965,9 +1247,39 @@ class ModeManagerUi(common.BaseDialogUi):
                         if mode.inherit == mode_name:
                             mode.inherit = name
 
-                self.modes_changed.emit()
-
-            self._populate_mode_layout()
+                self._mode_names.remove(mode_name)
+                self._mode_names.add(name)
+                self._ancestors[name] = self._ancestors.pop(mode_name)
+                for ancestors in self._ancestors.values():
+                    if mode_name in ancestors:
+                        ancestors.discard(mode_name)
+                        ancestors.add(name)
+
+                # Move the renamed mode's UI elements to the new name and
+                # move the entry to its sorted position in all other parent
+                # dropdowns, retaining their selection
+                for widgets in [
+                    self.mode_labels,
+                    self.mode_dropdowns,
+                    self.mode_rename,
+                    self.mode_delete
+                ]:
+                    widgets[name] = widgets.pop(mode_name)
+                with contextlib.ExitStack() as stack:
+                    selected = []
+                    for dropdown in self.mode_dropdowns.values():
+                        stack.enter_context(QtCore.QSignalBlocker(dropdown))
+                        if dropdown.currentText() == mode_name:
+                            selected.append(dropdown)
+                    self._set_row_mode(name)
+                    self._parent_model.removeRow(
+                        self._parent_model.stringList().index(mode_name)
+                    )
+                    self._insert_parent_entry(name)
+                    for dropdown in selected:
+                        dropdown.setCurrentText(name)
+
+                self._emit_modes_changed()
 
     def _delete_mode(self, mode_name):
         """Removes the specified mode.
@@ -979,24 +1291,37 @@ class ModeManagerUi(common.BaseDialogUi):
         """
         # Obtain mode from which the mode we want to delete inherits
         parent_of_deleted = None
-        for mode in list(self._profile.devices.values())[0].modes.values():
-            if mode.name == mode_name:
-                parent_of_deleted = mode.inherit
+        if self._reference_device is not None:
+            parent_of_deleted = \
+                self._reference_device.modes[mode_name].inherit
 
         # Assign the inherited mode of the the deleted one to all modes that
-        # inherit from the mode to be deleted
+        # inherit from the mode to be deleted and remove the mode from the
+        # profile
         for device in self._profile.devices.values():
             for mode in device.modes.values():
                 if mode.inherit == mode_name:
                     mode.inherit = parent_of_deleted
-
-        # Remove the mode from the profile
-        for device in self._profile.devices.values():
             del device.modes[mode_name]
-
-        # Update the ui
-        self._populate_mode_layout()
-        self.modes_changed.emit()
+        self._mode_names.remove(mode_name)
+        del self._ancestors[mode_name]
+        for ancestors in self._ancestors.values():
+            ancestors.discard(mode_name)
+
+        # Update the ui, reflecting the parent change of modes which
+        # inherited from the deleted mode
+        self._remove_mode_row(mode_name)
+        with contextlib.ExitStack() as stack:
+            for dropdown in self.mode_dropdowns.values():
+                stack.enter_context(QtCore.QSignalBlocker(dropdown))
+                if dropdown.currentText() == mode_name:
+                    dropdown.setCurrentText(
+                        parent_of_deleted if parent_of_deleted else "None"
+                    )
+            self._parent_model.removeRow(
+                self._parent_model.stringList().index(mode_name)
+            )
+        self._emit_modes_changed()
 
     def _add_mode_cb(self, checked):
         """Asks the user for a new mode to add.
@@ -1006,9 +1331,9 @@ class ModeManagerUi(common.BaseDialogUi):
 
         :param checked flag indicating whether or not the checkbox is active
         """
-        name, user_input = QtWidgets.QInputDialog.getText(None, "Mode name", "")
-        if user_input:
-            if name in gremlin.profile.mode_list(self._profile):
+        name, user_input = self._get_mode_name()
+        if user_input and name:
+            if name in self._mode_names:
                 gremlin.util.display_error(
                     "A mode with the name \"{}\" already exists".format(name)
                 )
@@ -1017,9 +1342,18 @@ class ModeManagerUi(common.BaseDialogUi):
                     new_mode = gremlin.profile.Mode(device)
                     new_mode.name = name
                     device.modes[name] = new_mode
-                self.modes_changed.emit()
-
-            self._populate_mode_layout()
+                self._mode_names.add(name)
+                self._ancestors[name] = set()
+
+                # Add the new mode as a potential parent to all modes and
+                # to the UI
+                with contextlib.ExitStack() as stack:
+                    for dropdown in self.mode_dropdowns.values():
+                        stack.enter_context(QtCore.QSignalBlocker(dropdown))
+                    self._insert_parent_entry(name)
+                self._add_mode_row(name, None, self.mode_layout.rowCount())
+
+                self._emit_modes_changed()
 
 
 class DeviceInformationUi(common.BaseDialogUi):
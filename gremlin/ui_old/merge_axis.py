@@ -39,6 +39,13 @@ class MergeAxisUi(common.BaseDialogUi):
 
         self.profile_data = profile_data
         self.entries = []
+        # Merge axis entries from the profile not yet shown in the UI
+        self._pending_entries = []
+
+        # Enumerate the devices once and share them with all entries
+        self._physical_devices = common.JoystickSelector.candidate_devices()
+        self._vjoy_devices = common.VJoySelector.candidate_devices()
+
         self.main_layout = QtWidgets.QVBoxLayout(self)
         self.merge_layout = QtWidgets.QVBoxLayout()
 
@@ -66,7 +73,12 @@ class MergeAxisUi(common.BaseDialogUi):
 
     def _add_entry(self, without_saving=False):
         """Adds a new axis to merge configuration entry."""
-        entry = MergeAxisEntry(self.to_profile, self.profile_data)
+        entry = MergeAxisEntry(
+            self.to_profile,
+            self.profile_data,
+            self._physical_devices,
+            self._vjoy_devices
+        )
         entry.closed.connect(self._remove_entry)
 
         self.entries.append(entry)
@@ -93,34 +105,15 @@ class MergeAxisUi(common.BaseDialogUi):
 
     def to_profile(self):
         """Saves all merge axis entries to the profile."""
-        self.profile_data.merge_axes = []
-        for entry in self.entries:
-            vjoy_sel = entry.vjoy_selector.get_selection()
-            joy1_sel = entry.joy1_selector.get_selection()
-            joy2_sel = entry.joy2_selector.get_selection()
-            mode_idx = entry.mode_selector.selector.currentIndex()
-            operation_str = entry.operation_selector.currentText()
-            self.profile_data.merge_axes.append({
-                "mode": entry.mode_selector.mode_list[mode_idx],
-                "operation": gremlin.common.MergeAxisOperation.to_enum(
-                    operation_str
-                ),
-                "vjoy": {
-                    "vjoy_id": vjoy_sel["device_id"],
-                    "axis_id": vjoy_sel["input_id"]
-                },
-                "lower": {
-                    "device_guid": joy1_sel["device_id"],
-                    "axis_id": joy1_sel["input_id"]
-                },
-                "upper": {
-                    "device_guid": joy2_sel["device_id"],
-                    "axis_id": joy2_sel["input_id"]
-                }
-            })
+        self.profile_data.merge_axes = \
+            [entry.data() for entry in self.entries] + self._pending_entries
 
     def from_profile(self):
-        """Populates the merge axis entries of the ui from the profile data."""
+        """Populates the merge axis entries of the ui from the profile data.
+
+        The UI entries are created one at a time from the event loop to keep
+        the dialog responsive for profiles with many merge axes.
+        """
         entries_to_remove = []
         for entry in self.profile_data.merge_axes:
             # Show an error if the desired vJoy device is no longer available
@@ -135,19 +128,31 @@ class MergeAxisUi(common.BaseDialogUi):
                         entry["vjoy"]["vjoy_id"]
                     )
                 )
-            else:
-                self._add_entry(True)
-                new_entry = self.entries[-1]
-                new_entry.select(entry)
 
         for entry in entries_to_remove:
             del self.profile_data.merge_axes[
                 self.profile_data.merge_axes.index(entry)
             ]
 
+        self._pending_entries = list(self.profile_data.merge_axes)
+        if len(self._pending_entries) > 0:
+            QtCore.QTimer.singleShot(0, self._add_pending_entry)
+
+    def _add_pending_entry(self):
+        """Creates the UI entry for the next merge axis from the profile."""
+        if len(self._pending_entries) == 0:
+            return
+
+        data = self._pending_entries.pop(0)
+        self._add_entry(True)
+        self.entries[-1].select(data)
+
+        if len(self._pending_entries) > 0:
+            QtCore.QTimer.singleShot(0, self._add_pending_entry)
+
     def _output_vjoy_devices(self):
         output_devices = []
-        for dev in gremlin.joystick_handling.vjoy_devices():
+        for dev in self._vjoy_devices:
             is_virtual = not self.profile_data.settings.vjoy_as_input.get(
                 dev.vjoy_id,
                 False
@@ -169,11 +174,20 @@ class MergeAxisEntry(QtWidgets.QDockWidget):
     palette = QtGui.QPalette()
     palette.setColor(QtGui.QPalette.Background, QtCore.Qt.lightGray)
 
-    def __init__(self, change_cb, profile_data, parent=None):
+    def __init__(
+            self,
+            change_cb,
+            profile_data,
+            physical_devices,
+            vjoy_devices,
+            parent=None
+    ):
         """Creates a new instance.
 
         :param change_cb function to execute when changes occur
         :param profile_data profile information
+        :param physical_devices sorted list of selectable physical devices
+        :param vjoy_devices sorted list of selectable vJoy devices
         :param parent the parent of this widget
         """
         QtWidgets.QDockWidget.__init__(self, parent)
@@ -188,20 +202,103 @@ class MergeAxisEntry(QtWidgets.QDockWidget):
         self.main_layout = QtWidgets.QGridLayout(self.main_widget)
         self.setWidget(self.main_widget)
 
+        # The selection widgets are only created once the entry is shown
+        # for the first time, until then any selection is kept as data
+        self._change_cb = change_cb
+        self._profile_data = profile_data
+        self._physical_devices = physical_devices
+        self._vjoy_devices = vjoy_devices
+        self._is_built = False
+        self._pending_data = None
+
+    def showEvent(self, event):
+        """Creates the selection widgets when the entry is first shown.
+
+        :param event the show event details
+        """
+        self._build_ui()
+        QtWidgets.QDockWidget.showEvent(self, event)
+
+    def closeEvent(self, event):
+        """Emits the closed event when this widget is being closed.
+
+        :param event the close event details
+        """
+        QtWidgets.QDockWidget.closeEvent(self, event)
+        self.closed.emit(self)
+
+    def select(self, data):
+        """Selects the specified entries in all drop downs.
+
+        If the drop downs have not been created yet the selection is
+        applied once they are.
+
+        :param data information about which entries to select
+        """
+        if self._is_built:
+            self._apply_selection(data)
+        else:
+            self._pending_data = data
+
+    def data(self):
+        """Returns the merge axis configuration represented by this entry.
+
+        :return dictionary describing the merge axis configuration
+        """
+        if not self._is_built:
+            if self._pending_data is not None:
+                return self._pending_data
+            self._build_ui()
+
+        vjoy_sel = self.vjoy_selector.get_selection()
+        joy1_sel = self.joy1_selector.get_selection()
+        joy2_sel = self.joy2_selector.get_selection()
+        mode_idx = self.mode_selector.selector.currentIndex()
+        operation_str = self.operation_selector.currentText()
+        return {
+            "mode": self.mode_selector.mode_list[mode_idx],
+            "operation": gremlin.common.MergeAxisOperation.to_enum(
+                operation_str
+            ),
+            "vjoy": {
+                "vjoy_id": vjoy_sel["device_id"],
+                "axis_id": vjoy_sel["input_id"]
+            },
+            "lower": {
+                "device_guid": joy1_sel["device_id"],
+                "axis_id": joy1_sel["input_id"]
+            },
+            "upper": {
+                "device_guid": joy2_sel["device_id"],
+                "axis_id": joy2_sel["input_id"]
+            }
+        }
+
+    def _build_ui(self):
+        """Creates the selection widgets if they do not exist yet."""
+        if self._is_built:
+            return
+        self._is_built = True
+
+        change_cb = self._change_cb
+
         # Selectors for both physical and virtual joystick axis for the
         # mapping selection
         self.vjoy_selector = common.VJoySelector(
             lambda x: change_cb(),
             [gremlin.common.InputType.JoystickAxis],
-            profile_data.settings.vjoy_as_input
+            self._profile_data.settings.vjoy_as_input,
+            self._vjoy_devices
         )
         self.joy1_selector = common.JoystickSelector(
             lambda x: change_cb(),
-            [gremlin.common.InputType.JoystickAxis]
+            [gremlin.common.InputType.JoystickAxis],
+            self._physical_devices
         )
         self.joy2_selector = common.JoystickSelector(
             lambda x: change_cb(),
-            [gremlin.common.InputType.JoystickAxis]
+            [gremlin.common.InputType.JoystickAxis],
+            self._physical_devices
         )
 
         # Operation selection
@@ -216,7 +313,7 @@ class MergeAxisEntry(QtWidgets.QDockWidget):
 
         # Mode selection
         self.mode_selector = gremlin.ui.common.ModeWidget()
-        self.mode_selector.populate_selector(profile_data)
+        self.mode_selector.populate_selector(self._profile_data)
         self.mode_selector.mode_changed.connect(change_cb)
 
         # Assemble the complete ui
@@ -241,15 +338,11 @@ class MergeAxisEntry(QtWidgets.QDockWidget):
         self.main_layout.addWidget(self.operation_selector, 1, 3)
         self.main_layout.addWidget(self.mode_selector, 1, 4)
 
-    def closeEvent(self, event):
-        """Emits the closed event when this widget is being closed.
-
-        :param event the close event details
-        """
-        QtWidgets.QDockWidget.closeEvent(self, event)
-        self.closed.emit(self)
+        if self._pending_data is not None:
+            self._apply_selection(self._pending_data)
+            self._pending_data = None
 
-    def select(self, data):
+    def _apply_selection(self, data):
         """Selects the specified entries in all drop downs.
 
         :param data information about which entries to select
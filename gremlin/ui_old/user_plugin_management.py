@@ -37,6 +37,10 @@ class ModuleManagementController(QtCore.QObject):
         # The view managed by the controller
         self.view = ModuleManagementView()
 
+        # Module widgets indexed by the file name of their module, this
+        # mirrors the modules present in the profile
+        self._module_widgets = {}
+
         self.view.add_module.connect(self.new_module)
         self.refresh_module_list()
 
@@ -46,7 +50,7 @@ class ModuleManagementController(QtCore.QObject):
     def new_module(self, fname):
         if fname != "":
             # Only add a new entry if the module doesn't exist yet
-            if fname not in [v.file_name for v in self.profile_data.plugins]:
+            if fname not in self._module_widgets:
                 # Update the model
                 module = gremlin.profile.Plugin(self.profile_data)
                 module.file_name = fname
@@ -57,9 +61,7 @@ class ModuleManagementController(QtCore.QObject):
                 self.profile_data.plugins.append(module)
 
                 # Update the view
-                self.view.module_list.add_module(
-                    self._create_module_widget(self.profile_data.plugins[-1])
-                )
+                self._add_module_widget(self.profile_data.plugins[-1])
 
     def remove_module(self, file_name):
         # Remove the module from the model
@@ -69,9 +71,9 @@ class ModuleManagementController(QtCore.QObject):
                 break
 
         # Remove corresponding UI element
-        for module_widget in self.view.module_list.widget_list:
-            if module_widget.get_module_name() == file_name:
-                self.view.module_list.remove_module(module_widget)
+        module_widget = self._module_widgets.pop(file_name, None)
+        if module_widget is not None:
+            self.view.module_list.remove_module(module_widget)
 
     def create_new_module_instance(self, module_widget, module_data):
         # Create new data instance
@@ -85,10 +87,9 @@ class ModuleManagementController(QtCore.QObject):
     def refresh_module_list(self):
         # Empty module list and then add one module at a time
         self.view.module_list.clear()
+        self._module_widgets = {}
         for plugin in self.profile_data.plugins:
-            self.view.module_list.add_module(
-                self._create_module_widget(plugin)
-            )
+            self._add_module_widget(plugin)
 
     def remove_instance(self, instance, widget):
         # Remove model
@@ -189,6 +190,11 @@ class ModuleManagementController(QtCore.QObject):
     def _create_value_changed_cb(self, variable, widget, callback):
         return lambda data: callback(data, widget, variable)
 
+    def _add_module_widget(self, module_data):
+        module_widget = self._create_module_widget(module_data)
+        self._module_widgets[module_data.file_name] = module_widget
+        self.view.module_list.add_module(module_widget)
+
     def _create_module_widget(self, module_data):
         # Create the module widget
         module_widget = ModuleWidget(module_data.file_name)
@@ -320,7 +326,7 @@ class ModuleListWidget(QtWidgets.QScrollArea):
         self.content_layout.removeWidget(module_widget)
 
         del self.widget_list[self.widget_list.index(module_widget)]
-        del module_widget
+        module_widget.deleteLater()
 
     def clear(self):
         self.widget_list = []
@@ -375,7 +381,7 @@ class ModuleWidget(QtWidgets.QFrame):
     def remove_instance(self, widget):
         widget.hide()
         self.instance_layout.removeWidget(widget)
-        del widget
+        widget.deleteLater()
 
 
 class InstanceWidget(QtWidgets.QWidget):
@@ -847,6 +847,9 @@ def format_name(name: str) -> str:
         re.sub("[^A-Za-z0-9]", "", name.lower()[1:])
 
 
+_python_identifier_regex = re.compile(r"^[^\d\W]\w*\Z")
+
+
 def valid_python_identifier(name: str) -> bool:
     """Returns whether a given name is a valid python identifier.
 
@@ -856,7 +859,7 @@ def valid_python_identifier(name: str) -> bool:
     Returns:
         True if the name is a valid identifier, False otherwise
     """
-    return re.match(r"^[^\d\W]\w*\Z", name) is not None
+    return _python_identifier_regex.match(name) is not None
 
 
 def clamp(value: float, min_val: float, max_val: float) -> float:
@@ -145,4 +145,12 @@ def test_read_property():
     with pytest.raises(gremlin.error.ProfileError, match=r"Property element is missing"):
         gremlin.util.read_property(
             doc, "value", gremlin.types.PropertyType.Int
-        )
\ No newline at end of file
+        )
+
+
+def test_valid_python_identifier():
+    assert gremlin.util.valid_python_identifier("value")
+    assert gremlin.util.valid_python_identifier("_value_2")
+    assert not gremlin.util.valid_python_identifier("2value")
+    assert not gremlin.util.valid_python_identifier("my value")
+    assert not gremlin.util.valid_python_identifier("")